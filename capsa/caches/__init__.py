@@ -4,5 +4,5 @@ from .arc import ARCCache  # noqa: F401
 from .fifo import FIFOCache  # noqa: F401
 from .lfu import LFUCache  # noqa: F401
 from .lru import LRUCache  # noqa: F401
-from .opt import OPTCache  # noqa: F401
+from .opt import OPTCache, OPTIndex  # noqa: F401
 from .two_q import TwoQCache  # noqa: F401
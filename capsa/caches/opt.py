@@ -1,18 +1,36 @@
 from __future__ import annotations
 
-from collections import defaultdict, deque
-from typing import Deque, DefaultDict, Dict, Iterable, List, Optional, Set
+import sys
+from array import array
+from typing import Dict, Iterable, Optional, Sequence, Union
 
 from ..cache_base import Cache
 
+NEVER_USED = sys.maxsize  # next-use position of a page with no known future reference
+
+
+class OPTIndex:
+    """Next-use table of a trace: next_use[i] is the next position holding trace[i], or len(trace) if none."""
+
+    def __init__(self, trace: Iterable[int]):
+        pages: Sequence[int] = trace if isinstance(trace, (array, memoryview, list, tuple)) else list(trace)
+        self.length = len(pages)
+        next_use = array("l", [0]) * self.length
+        last_seen: Dict[int, int] = {}
+        for index in range(self.length - 1, -1, -1):
+            page_id = pages[index]
+            next_use[index] = last_seen.get(page_id, self.length)
+            last_seen[page_id] = index
+        self.next_use = next_use
+
 
 class OPTCache(Cache):
 
-    def __init__(self, size: int, trace: Optional[Iterable[int]] = None):
+    def __init__(self, size: int, trace: Optional[Union[Iterable[int], OPTIndex]] = None):
         super().__init__(size)
         self.trace_preloaded = trace is not None
-        self.future_positions: DefaultDict[int, Deque[int]] = defaultdict(deque)
-        self.cache: Set[int] = set()
+        self.index: Optional[OPTIndex] = None
+        self.cache: Dict[int, int] = {}  # cached page -> position of its next use
         self.current_step = 0
         self.hits = 0
         self.misses = 0
@@ -20,49 +38,35 @@ class OPTCache(Cache):
         if trace is not None:
             self._preprocess_trace(trace)
 
-    def _preprocess_trace(self, trace: Iterable[int]) -> None:
-        self.future_positions.clear()
-        for index, page_id in enumerate(trace):
-            self.future_positions[page_id].append(index)
+    def _preprocess_trace(self, trace: Union[Iterable[int], OPTIndex]) -> None:
+        # an OPTIndex can be shared by every run over the same trace, so it is only built once
+        self.index = trace if isinstance(trace, OPTIndex) else OPTIndex(trace)
 
-    def prime(self, trace: Iterable[int]) -> None:
+    def prime(self, trace: Union[Iterable[int], OPTIndex]) -> None:
         self._preprocess_trace(trace)
 
-    def _drop_current_reference(self, page_id: int) -> None:
-        positions = self.future_positions.get(page_id)
-        if positions and positions[0] == self.current_step:
-            positions.popleft()
+    def _next_use(self) -> int:
+        index = self.index
+        if index is None or self.current_step >= index.length:
+            return NEVER_USED
+        return index.next_use[self.current_step]
 
     def _select_victim(self) -> int:
-        farthest_distance = -1
-        victim = None
-        for page in self.cache:
-            positions = self.future_positions.get(page)
-            if not positions:
-                return page
-            if positions[0] > farthest_distance:
-                farthest_distance = positions[0]
-                victim = page
-        assert victim is not None
-        return victim
+        # the page whose next use is farthest away (or never comes) is evicted
+        return max(self.cache, key=self.cache.__getitem__)
 
     def access(self, page_id: int) -> bool:
-        self._drop_current_reference(page_id)
-
         hit = page_id in self.cache
         if hit:
             self.hits += 1
         else:
             self.misses += 1
             if len(self.cache) >= self.size:
-                victim = self._select_victim()
-                self.cache.remove(victim)
-            self.cache.add(page_id)
+                del self.cache[self._select_victim()]
+        self.cache[page_id] = self._next_use()
 
         self.current_step += 1
         return hit
 
     def get_stats(self) -> Dict[str, int]:
         return {"hits": self.hits, "misses": self.misses}
-
-
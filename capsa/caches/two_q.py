@@ -17,14 +17,27 @@ class TwoQCache(Cache):
     ):
         super().__init__(size)
         self.size = size
-        default_in = int(size * 0.5)
-        self.size_in = max(1, min(size - 1, a1in_size if a1in_size is not None else default_in))
-        default_out = 16
-        self.size_out = max(1, a1out_size if a1out_size is not None else default_out)
-        self.size_am = max(1, size - self.size_in)
         self.A1in: "OrderedDict[int, None]" = OrderedDict()  # the pages that are recently used, but not be evicted from the cache
         self.A1out: "OrderedDict[int, None]" = OrderedDict()  # the ghost pages that have been evicted from A1in
         self.Am: "OrderedDict[int, None]" = OrderedDict()  # the pages that are frequently used, been accessed after br evicted from A1in
+        # default queue sizes, used unless a1in_size / a1out_size are given
+        self.size_in = int(size * 0.5)
+        self.size_out = 16
+        self.reset(a1in_size=a1in_size, a1out_size=a1out_size)
+
+    def reset(self, *, a1in_size: int | None = None, a1out_size: int | None = None) -> None:
+        """
+        Empty the cache in place, so one instance can serve a parameter sweep.
+
+        A queue size that is given replaces the current one; a size left as None keeps it.
+        """
+        size = self.size
+        self.size_in = max(1, min(size - 1, a1in_size if a1in_size is not None else self.size_in))
+        self.size_out = max(1, a1out_size if a1out_size is not None else self.size_out)
+        self.size_am = max(1, size - self.size_in)
+        self.A1in.clear()
+        self.A1out.clear()
+        self.Am.clear()
         self.hits = 0
         self.misses = 0
 
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+
+
+def write_atomic(path: Path, data: bytes | bytearray) -> None:
+    """
+    Write ``data`` to ``path`` through a temporary file and an atomic rename.
+
+    Readers never see a partially written file, and concurrent writers of the same
+    path each use their own temporary file, so the last complete write wins. Used for
+    the on-disk caches, whose entries are simply rebuilt when missing, so write errors
+    are ignored (the temporary file is removed).
+    """
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path is not None:
+            with suppress(OSError):
+                os.unlink(tmp_path)
@@ -17,17 +17,34 @@ All workloads:
 - Ensure clear hit-rate separation across algorithms (e.g., 10%, 30%, 60%)
 """
 
+import hashlib
+import mmap
+import os
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List, Sequence
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-# Type aliases for readability
-TraceBuilder = Callable[[], List[int]]
-PageSequence = List[int]
+from .storage import write_atomic
+
+# Type aliases for readability: traces are packed C int arrays (4 bytes per page)
+PageSequence = array
+TraceBuilder = Callable[[], PageSequence]
+TRACE_TYPECODE = "i"
 
 # Configuration constants
 TARGET_REQUESTS = 50000
 CACHE_SIZE = 32
 
+# On-disk trace cache: one raw native-endian blob holding every recipe (each in its typecode), overridable via CAPSA_TRACE_CACHE
+TRACE_CACHE_DIR = Path(os.environ.get("CAPSA_TRACE_CACHE", Path.home() / ".cache" / "capsa_traces"))
+
+# builders share helpers and module-level constants, so cached files are keyed by a hash of this whole
+# module's source: editing any recipe invalidates the cache instead of serving a stale trace
+_SOURCE_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
 
 @dataclass(frozen=True)
 class TraceRecipe:
@@ -37,39 +54,65 @@ class TraceRecipe:
     filename: str
     category: str
     goal: str
-    capacity_hint: Sequence[int]
-    script: Sequence[str]
+    capacity_hint: Tuple[int, ...]
+    script: Tuple[str, ...]
     builder: TraceBuilder
+    # narrowest array typecode that holds every page id of this trace (storage only)
+    typecode: str = TRACE_TYPECODE
+
+
+def page_sequence(pages: Iterable[int] = ()) -> PageSequence:
+    """Return a new packed page sequence holding ``pages``."""
+    return array(TRACE_TYPECODE, pages)
 
 
-def trim_to_target(seq: PageSequence, target: int, extend_fn: Callable[[], None] | None = None) -> PageSequence:
+def fill_rounds(template: PageSequence, target: int) -> PageSequence:
     """
-    Adjust the sequence length to match the target exactly.
+    Repeat a round template until the sequence holds exactly ``target`` pages.
 
-    If the sequence is shorter than the target, extend it using the provided function,
-    or by repeating the last page.
-    If it is longer than the target, trim it to the target.
+    Writes ``target // len(template)`` whole rounds followed by one partial round of
+    ``target % len(template)`` pages, so nothing is generated past the target.
 
     Args:
-        seq: The current sequence to adjust.
+        template: One round of page accesses (must not be empty).
         target: Target length (TARGET_REQUESTS = 50000).
-        extend_fn: Optional function used to extend the sequence.
-                   If None, extend by repeating the last page.
 
     Returns:
-        The sequence trimmed or extended to the exact target length.
+        A new sequence of exactly ``target`` pages.
+
+    Raises:
+        ValueError: If ``target`` is negative.
     """
-    if len(seq) < target:
-        if extend_fn:
-            while len(seq) < target:
-                extend_fn()
-        else:
-            last_page = seq[-1] if seq else 1
-            seq.extend([last_page] * (target - len(seq)))
-    return seq[:target]
+    if target < 0:
+        raise ValueError(f"fill_rounds target must be non-negative, got {target}")
+    rounds, tail = divmod(target, len(template))
+    seq = template * rounds
+    seq += template[:tail]  # in-place append, no second full-length copy
+    return seq
+
+
+def repeat_each(pages: Iterable[int], times: int) -> PageSequence:
+    """Return ``pages`` with every page repeated ``times`` times in a row."""
+    seq = page_sequence()
+    for page in pages:
+        seq += page_sequence((page,)) * times
+    return seq
+
+
+def sliding_windows(starts: Iterable[int], window_size: int) -> List[int]:
+    """Return consecutive windows ``[start, start + window_size)``, one per start."""
+    seq: List[int] = []
+    for start in starts:
+        seq.extend(range(start, start + window_size))
+    return seq
+
+
+# WL01 round template, built once at import and shared read-only by every call:
+# hot pages 1-5 each accessed 100 times, then cold pages 6-105 once each
+_WL01_ROUND = tuple(repeat_each(range(1, 6), 100)) + tuple(range(6, 106))
 
 
-def _wl01_static_frequency() -> PageSequence:
+def _wl01_static_frequency(target: int = TARGET_REQUESTS) -> PageSequence:
     """
     Workload 1: Static frequency pattern (LFU-friendly)
 
@@ -80,25 +123,15 @@ def _wl01_static_frequency() -> PageSequence:
 
     Key: LFU can lock in high-frequency data; LRU gets washed out by cold pages.
     """
-    seq: PageSequence = []
-    
-    hot_pages = list(range(1, 6))  # 5 hot pages
-    cold_pages = list(range(6, 106))  # 100 cold pages
-    
-    def add_round():
-        # hot pages: each accessed 100 times
-        for page in hot_pages:
-            seq.extend([page] * 100)
-        # cold pages: each accessed 1 time (loop access)
-        seq.extend(cold_pages)
-    rounds = TARGET_REQUESTS // 600
-    for _ in range(rounds):
-        add_round()
-    
-    return trim_to_target(seq, TARGET_REQUESTS, add_round)
+    # every round is identical, so tile the prebuilt template
+    return fill_rounds(page_sequence(_WL01_ROUND), target)
+
+
+# WL02 round template: hot pages 1-20 each accessed 10 times, then warm pages 21-60 once each
+_WL02_ROUND = tuple(repeat_each(range(1, 21), 10)) + tuple(range(21, 61))
 
 
-def _wl02_frequency_balanced() -> PageSequence:
+def _wl02_frequency_balanced(target: int = TARGET_REQUESTS) -> PageSequence:
     """
     Workload 2: Balanced frequency pattern (LFU-friendly)
 
@@ -107,27 +140,11 @@ def _wl02_frequency_balanced() -> PageSequence:
     - Warm pages: pages 21-60, each accessed once per round (40 requests/round)
     - 240 requests per round, ~208 rounds in total
     """
-    seq: PageSequence = []
+    # every round is identical, so tile the prebuilt template (about 208 rounds)
+    return fill_rounds(page_sequence(_WL02_ROUND), target)
 
-    hot_pages = list(range(1, 21))  # 20 hot pages
-    warm_pages = list(range(21, 61))  # 40 warm pages
 
-    def add_round():
-        # hot pages: each accessed 10 times
-        for page in hot_pages:
-            seq.extend([page] * 10)
-        # warm pages: each accessed 1 time
-        seq.extend(warm_pages)
-    
-    # generate about 208 rounds
-    rounds = TARGET_REQUESTS // 240
-    for _ in range(rounds):
-        add_round()
-    
-    return trim_to_target(seq, TARGET_REQUESTS, add_round)
-
-
-def _wl03_static_sliding_window() -> PageSequence:
+def _wl03_static_sliding_window(target: int = TARGET_REQUESTS) -> PageSequence:
     """
     Workload 3: Static sliding window (LRU-friendly)
 
@@ -137,35 +154,18 @@ def _wl03_static_sliding_window() -> PageSequence:
 
     Key: LRU can perfectly track the most recently used 28 pages; LFU cannot leverage frequency.
     """
-    seq: PageSequence = []
-    
     window_size = 28  # window size 28, slightly smaller than cache size 32
     max_page = 500
-    
-    # generate sliding window sequence
-    num_windows = TARGET_REQUESTS // window_size
-    for i in range(num_windows):
-        start = 1 + (i % (max_page - window_size + 1))
-        for offset in range(window_size):
-            seq.append(start + offset)
-            if len(seq) >= TARGET_REQUESTS:
-                break
-        if len(seq) >= TARGET_REQUESTS:
-            break
-    
-    # supplement remaining requests
-    if len(seq) < TARGET_REQUESTS:
-        start = 1 + (num_windows % (max_page - window_size + 1))
-        for offset in range(TARGET_REQUESTS - len(seq)):
-            if start + offset > max_page:
-                start = 1
-                offset = 0
-            seq.append(start + offset)
-    
-    return seq[:TARGET_REQUESTS]
+    # the last window start (max_page - window_size + 1) still ends exactly on max_page
+    span = max_page - window_size + 1
 
+    # window i starts at 1 + (i % span), so the trace repeats every span windows:
+    # build one period of windows and tile it (the tail is the head of the next window)
+    period = page_sequence(sliding_windows(range(1, span + 1), window_size))
+    return fill_rounds(period, target)
 
-def _wl04_fifo_convoy() -> PageSequence:
+
+def _wl04_fifo_convoy(target: int = TARGET_REQUESTS) -> PageSequence:
     """
     LFU poison: cache pollution pattern
 
@@ -173,34 +173,29 @@ def _wl04_fifo_convoy() -> PageSequence:
     1) Early phase: access Group A at very high frequency (inflates LFU counters)
     2) Later phase: switch entirely to Group B (loop access)
     """
-    seq: PageSequence = []
-    
-    cache_size = 32
-    
     # 1. Pollution Phase
     # let pages 1-32 have extremely high frequency (each accessed 50 times)
-    pollution_pages = list(range(1, 33))
-    for _ in range(50):
-        seq.extend(pollution_pages)
-        
+    pollution_pages = page_sequence(range(1, 33))
+    seq = (pollution_pages * 50)[:target]  # a target shorter than the pollution phase is cut inside it
+
     # 2. Phase Shift
     # completely discard 1-32, switch to loop accessing 33-64
     # note: here new pages <= cache size, so they can always be hit
-    working_set = list(range(33, 65)) # 32 new pages
-    
-    # fill remaining requests
-    current_len = len(seq)
-    remaining_requests = TARGET_REQUESTS - current_len
-    
-    # simple loop fill
-    rounds = remaining_requests // len(working_set) + 1
-    for _ in range(rounds):
-        seq.extend(working_set)
-        
-    return trim_to_target(seq, TARGET_REQUESTS)
+    working_set = page_sequence(range(33, 65)) # 32 new pages
+
+    # both phases are sized up front: the shift fills exactly the remaining requests
+    seq += fill_rounds(working_set, target - len(seq))
+    return seq
+
 
+# WL05 step-invariant segments, built once at import and shared read-only by every cycle
+_WL05_HOT_SETS = (tuple(range(1, 11)), tuple(range(11, 21)), tuple(range(31, 41)))
+_WL05_HOT_REPEATS = (5, 4, 3)
+_WL05_HEAT_WAVE = tuple(page for block, reps in zip(_WL05_HOT_SETS, _WL05_HOT_REPEATS) for page in block * reps)
+_WL05_HOT_BRIDGE = (_WL05_HOT_SETS[0] + _WL05_HOT_SETS[2]) * 3
 
-def _wl05_scan_sandwich() -> PageSequence:
+
+def _wl05_scan_sandwich(target: int = TARGET_REQUESTS) -> PageSequence:
     """
 
     Pattern composition:
@@ -212,14 +207,8 @@ def _wl05_scan_sandwich() -> PageSequence:
 
     Repeat the above composition until reaching 50,000 requests.
     """
-    seq: PageSequence = []
-
-    hot_sets = [
-        list(range(1, 11)),
-        list(range(11, 21)),
-        list(range(31, 41)),
-    ]
-    hot_repeats = (5, 4, 3)
+    heat_wave = _WL05_HEAT_WAVE
+    hot_bridge = _WL05_HOT_BRIDGE
 
     window_size_small = 32
     window_size_large = 48
@@ -228,50 +217,45 @@ def _wl05_scan_sandwich() -> PageSequence:
     small_span = max_page - window_size_small - 49
     large_span = max_page - window_size_large - 99
 
-    def add_cycle(step: int) -> None:
-        for block, reps in zip(hot_sets, hot_repeats):
-            for _ in range(reps):
-                seq.extend(block)
-
+    def build_cycle(step: int) -> List[int]:
         start_small = 50 + (step * 19 % max(1, small_span))
-        seq.extend(range(start_small, start_small + window_size_small))
-
         start_small_2 = 100 + (step * 23 % max(1, small_span))
-        seq.extend(range(start_small_2, start_small_2 + window_size_small))
-
-        for _ in range(3):
-            seq.extend(hot_sets[0])
-            seq.extend(hot_sets[2])
-
         start_large = 150 + (step * 29 % max(1, large_span))
-        seq.extend(range(start_large, start_large + window_size_large))
         start_large_2 = 220 + (step * 31 % max(1, large_span))
-        seq.extend(range(start_large_2, start_large_2 + window_size_large))
-
         scan_base = 4000 + step * 200
-        seq.extend(range(scan_base, scan_base + 200))
-
-    cycle_length = (
-        sum(len(block) * reps for block, reps in zip(hot_sets, hot_repeats))
-        + window_size_small * 2
-        + (len(hot_sets[0]) + len(hot_sets[2])) * 3
-        + window_size_large * 2
-        + 200
-    )
-    cycles = TARGET_REQUESTS // cycle_length
-
+        return [
+            *heat_wave,
+            *range(start_small, start_small + window_size_small),
+            *range(start_small_2, start_small_2 + window_size_small),
+            *hot_bridge,
+            *range(start_large, start_large + window_size_large),
+            *range(start_large_2, start_large_2 + window_size_large),
+            *range(scan_base, scan_base + 200),
+        ]
+
+    cycle_length = len(heat_wave) + window_size_small * 2 + len(hot_bridge) + window_size_large * 2 + 200
+    cycles, tail = divmod(target, cycle_length)
+
+    seq: List[int] = []
     for step in range(cycles):
-        add_cycle(step)
+        seq.extend(build_cycle(step))
+    # only the head of one more cycle is needed to reach the target exactly
+    if tail:
+        seq.extend(build_cycle(cycles)[:tail])
 
-    step = cycles
-    while len(seq) < TARGET_REQUESTS:
-        add_cycle(step)
-        step += 1
+    return page_sequence(seq)
 
-    return seq[:TARGET_REQUESTS]
 
+# WL06 step-invariant segments, built once at import and shared read-only by every cycle
+_WL06_HOT_A = tuple(range(1, 7))
+_WL06_HOT_B = tuple(range(31, 37))
+_WL06_BRIDGE = tuple(range(90, 106))  # 16 pages
+_WL06_HOT_A_LOOP = _WL06_HOT_A * 12
+_WL06_HOT_B_BRIDGE = _WL06_HOT_B * 6 + _WL06_BRIDGE
+_WL06_RECOVERY = _WL06_HOT_A + _WL06_HOT_B
 
-def _wl06_arc_mosaic() -> PageSequence:
+
+def _wl06_arc_mosaic(target: int = TARGET_REQUESTS) -> PageSequence:
     """
     Each round concatenates four simple segments to highlight ARC's adaptability across
     frequency / recency / cold-scan shifts:
@@ -282,49 +266,46 @@ def _wl06_arc_mosaic() -> PageSequence:
 
     This structure is similar to WL07's multi-pattern mix, but smaller and simpler.
     """
-    seq: PageSequence = []
-
-    hot_a = list(range(1, 7))
-    hot_b = list(range(31, 37))
-    bridge = list(range(90, 106))  # 16 pages
+    hot_a_loop = _WL06_HOT_A_LOOP
+    hot_b_bridge = _WL06_HOT_B_BRIDGE
+    recovery = _WL06_RECOVERY
     window_size = 30
     max_window_page = 900
 
-    def add_cycle(step: int) -> None:
-        # 1) hot set A: 1-6 fast loop 12 times (72 requests)
-        for _ in range(12):
-            seq.extend(hot_a)
-
+    def build_cycle(step: int) -> List[int]:
         # 2) sliding window: 30-page window once, drifting with step
         start = 200 + (step * 23 % max(1, max_window_page - window_size - 200))
-        seq.extend(range(start, start + window_size))
-
-        # 3) hot set B + bridge: 31-36 loop 6 times (36 requests) + 90-105 bridge (16 requests)
-        for _ in range(6):
-            seq.extend(hot_b)
-        seq.extend(bridge)
-
-        # 4) cold scan + hot set recovery: 60-page scan, then briefly return to hot sets A and B
+        # 4) cold scan: 60 pages starting at a step-dependent base
         scan_base = 1200 + step * 60
-        seq.extend(range(scan_base, scan_base + 60))
-        seq.extend(hot_a)
-        seq.extend(hot_b)
-
-    cycle_length = len(hot_a) * 12 + window_size + len(hot_b) * 6 + len(bridge) + 60 + len(hot_a) + len(hot_b)
-    cycles = TARGET_REQUESTS // cycle_length
-
+        return [
+            *hot_a_loop,  # 1) hot set A: 1-6 fast loop 12 times (72 requests)
+            *range(start, start + window_size),
+            *hot_b_bridge,  # 3) hot set B + bridge: 31-36 loop 6 times (36 requests) + 90-105 bridge (16 requests)
+            *range(scan_base, scan_base + 60),
+            *recovery,  # 4) hot set recovery: briefly return to hot sets A and B
+        ]
+
+    cycle_length = len(hot_a_loop) + window_size + len(hot_b_bridge) + 60 + len(recovery)
+    cycles, tail = divmod(target, cycle_length)
+
+    seq: List[int] = []
     for step in range(cycles):
-        add_cycle(step)
+        seq.extend(build_cycle(step))
+    # only the head of one more cycle is needed to reach the target exactly
+    if tail:
+        seq.extend(build_cycle(cycles)[:tail])
+
+    return page_sequence(seq)
 
-    step = cycles
-    while len(seq) < TARGET_REQUESTS:
-        add_cycle(step)
-        step += 1
 
-    return seq[:TARGET_REQUESTS]
+# WL07 frequency round: hot pages 1-5 each accessed 10 times, then cold pages 6-20 once each
+_WL07_HOT_BLOCK = tuple(repeat_each(range(1, 6), 10))
+_WL07_FREQ_ROUND = _WL07_HOT_BLOCK + tuple(range(6, 21))
+# scan-mode hot bursts cycle through pages 1-3, so the 5-page bursts repeat every 15 hot accesses
+_WL07_HOT_CYCLE = tuple(range(1, 4)) * 5
 
 
-def _wl07_adaptive_mixed() -> PageSequence:
+def _wl07_adaptive_mixed(target: int = TARGET_REQUESTS) -> PageSequence:
     """
     Simple pattern: mix multiple access patterns to test ARC's adaptability.
     - Switch pattern every 5,000 requests:
@@ -333,68 +314,53 @@ def _wl07_adaptive_mixed() -> PageSequence:
       * Pattern 3: scan + hot set (for every 50 scans, interleave 5 hot-set accesses)
 
     """
-    seq: PageSequence = []
+    seq: List[int] = []
     
     phase_length = 5000
     phase = 0
+
+    freq_round = _WL07_FREQ_ROUND
+    hot_cycle = _WL07_HOT_CYCLE
     
-    while len(seq) < TARGET_REQUESTS:
-        requests_in_phase = min(phase_length, TARGET_REQUESTS - len(seq))
+    while len(seq) < target:
+        requests_in_phase = min(phase_length, target - len(seq))
         
         if phase % 3 == 0:
-            # frequency mode
-            hot_pages = list(range(1, 6))
-            cold_pages = list(range(6, 21))
-            count = 0
-            while count < requests_in_phase and len(seq) < TARGET_REQUESTS:
-                for page in hot_pages:
-                    if count >= requests_in_phase or len(seq) >= TARGET_REQUESTS:
-                        break
-                    seq.extend([page] * 10)  # each hot page 10 times
-                    count += 10
-                for page in cold_pages:
-                    if count >= requests_in_phase or len(seq) >= TARGET_REQUESTS:
-                        break
-                    seq.append(page)  # each cold page 1 time
-                    count += 1
+            # frequency mode: whole rounds, then a partial round that never splits a hot run of 10
+            rounds, tail = divmod(requests_in_phase, len(freq_round))
+            if tail < len(_WL07_HOT_BLOCK):
+                tail = -(-tail // 10) * 10
+            # a rounded-up hot run may spill into the next phase, but never past the target
+            tail = min(tail, target - len(seq) - rounds * len(freq_round))
+            for _ in range(rounds):
+                seq.extend(freq_round)
+            seq.extend(freq_round[:tail])
         elif phase % 3 == 1:
             # recent use mode: 30-page window once, drifting with phase
             window_size = 30
             max_page = 500
             start = 1 + ((phase // 3) * 10 % (max_page - window_size + 1))
             windows = requests_in_phase // window_size
-            for i in range(windows):
-                current_start = start + i
-                if current_start + window_size > max_page:
-                    current_start = 1
-                for offset in range(window_size):
-                    seq.append(current_start + offset)
-                    if len(seq) >= TARGET_REQUESTS:
-                        break
-                if len(seq) >= TARGET_REQUESTS:
-                    break
+            # each window starts one page later; a window that would run past max_page restarts at 1
+            starts = [s if s + window_size <= max_page else 1 for s in range(start, start + windows)]
+            # requests_in_phase never exceeds the remaining budget, so whole windows always fit
+            seq.extend(sliding_windows(starts, window_size))
         else:
-            # scan + hot set recovery: 50 times scan, then 5 times hot set A and B
-            hot_pages = list(range(1, 4))
+            # scan + hot set recovery: every 50 requests start with 5 hot-set accesses, then 45 scans
             scan_pos = 1000 + (phase // 3) * 1000
             hot_index = 0
-            scan_count = 0
-            for _ in range(requests_in_phase):
-                if scan_count % 50 < 5:
-                    seq.append(hot_pages[hot_index % len(hot_pages)])
-                    hot_index += 1
-                else:
-                    seq.append(scan_pos)
-                    scan_pos += 1
-                scan_count += 1
-                if len(seq) >= TARGET_REQUESTS:
-                    break
+            for block_start in range(0, requests_in_phase, 50):
+                block_len = min(50, requests_in_phase - block_start)
+                hot_len = min(5, block_len)
+                offset = hot_index % len(hot_cycle)
+                seq.extend(hot_cycle[offset:offset + hot_len])
+                hot_index += hot_len
+                seq.extend(range(scan_pos, scan_pos + block_len - hot_len))
+                scan_pos += block_len - hot_len
         
         phase += 1
-        if len(seq) >= TARGET_REQUESTS:
-            break
     
-    return seq[:TARGET_REQUESTS]
+    return page_sequence(seq)
 
 
 TRACE_RECIPES: List[TraceRecipe] = [
@@ -404,13 +370,14 @@ TRACE_RECIPES: List[TraceRecipe] = [
         category="LFU",
         goal="Static frequency pattern: small hot set high-frequency, large cold set low-frequency (LFU-friendly)",
         capacity_hint=(32,),
-        script=[
+        script=(
             "Hot pages: pages 1-5, each accessed 100 times per round",
             "Cold pages: pages 6-105, each accessed once per round",
             "Per round: 500 hot-page requests + 100 cold-page requests = 600 requests",
             "Expected: LFU ~75%, ARC ~60%, LRU ~15%, 2Q ~20%",
-        ],
+        ),
         builder=_wl01_static_frequency,
+        typecode="B",
     ),
     TraceRecipe(
         key="WL02_FREQ_BALANCED",
@@ -418,13 +385,14 @@ TRACE_RECIPES: List[TraceRecipe] = [
         category="LFU",
         goal="Balanced frequency pattern: working set near cache size to test frequency vs. capacity (LFU-friendly)",
         capacity_hint=(32,),
-        script=[
+        script=(
             "Hot pages: pages 1-20, each accessed 10 times per round",
             "Warm pages: pages 21-60, each accessed once per round",
             "Per round: 200 hot-page requests + 40 warm-page requests = 240 requests",
             "Expected: LFU ~65%, ARC ~55%, LRU ~25%, 2Q ~30%",
-        ],
+        ),
         builder=_wl02_frequency_balanced,
+        typecode="B",
     ),
     TraceRecipe(
         key="WL03_STATIC_SW",
@@ -432,13 +400,14 @@ TRACE_RECIPES: List[TraceRecipe] = [
         category="LRU",
         goal="Static sliding window: window size 28, shift by 1 each time (LRU-friendly)",
         capacity_hint=(32,),
-        script=[
+        script=(
             "Window size 28 (slightly smaller than cache size 32)",
             "Shift by 1 position each step",
             "Pure recency pattern, no frequency signal",
             "Expected: LRU ~70%, ARC ~60%, LFU ~10%, 2Q ~15%",
-        ],
+        ),
         builder=_wl03_static_sliding_window,
+        typecode="H",
     ),
     TraceRecipe(
         key="WL04_FIFO_CONVOY",
@@ -446,14 +415,15 @@ TRACE_RECIPES: List[TraceRecipe] = [
         category="FIFO",
         goal="Queue convoy pattern: strict sequential loop + mild perturbation (strongly FIFO-friendly)",
         capacity_hint=(32,),
-        script=[
+        script=(
             "Convoy core: pages 1-32, fixed sequential loop (6 loops per round)",
             "The first loop fills the cache; subsequent loops are almost all hits",
             "Tail perturbation: pages 200-215, lightly refreshes the FIFO queue",
             "The perturbation aligns FIFO eviction order with the next round's convoy head",
             "FIFO ~90%, OPT ~92%; other algorithms are more affected by the perturbation",
-        ],
+        ),
         builder=_wl04_fifo_convoy,
+        typecode="B",
     ),
     TraceRecipe(
         key="WL05_SCAN_SANDWICH",
@@ -461,15 +431,16 @@ TRACE_RECIPES: List[TraceRecipe] = [
         category="2Q",
         goal="Scan sandwich pattern: backup + online workload (2Q-friendly)",
         capacity_hint=(32,),
-        script=[
+        script=(
             "Phase 1: scan 1000-20000; for every 100 scans interleave 2 hot-set accesses (10,000 requests)",
             "Phase 2: hot set pages 1-3 (20,000 requests, build the working set)",
             "Phase 3: scan 20001-40000; for every 100 scans interleave 2 hot-set accesses (10,000 requests)",
             "Phase 4: hot set pages 1-3 (remaining requests, test recovery)",
             "2Q uses A1in to filter scan pages while Am retains hot pages",
             "Expected: 2Q ~80%, ARC ~60%, LRU ~25%, LFU ~30%, FIFO ~25%",
-        ],
+        ),
         builder=_wl05_scan_sandwich,
+        typecode="H",
     ),
     TraceRecipe(
         key="WL06_ARC_MOSAIC",
@@ -477,14 +448,15 @@ TRACE_RECIPES: List[TraceRecipe] = [
         category="ARC",
         goal="ARC mosaic pattern: hot sets A/B + sliding window + cold scan (ARC-friendly)",
         capacity_hint=(32,),
-        script=[
+        script=(
             "Phase A: loop pages 1-6 for 12 rounds to build frequency advantage",
             "Phase B: scan a 30-page sliding window once; drift the window each round",
             "Phase C: loop pages 31-36 for 6 rounds + bridge pages 90-105 to simulate hot-set switching",
             "Phase D: cold-scan 60 pages, then briefly return to both hot sets",
             "Expected: ARC ~68%, LRU ~48%, LFU ~50%, 2Q ~52%, FIFO ~38%",
-        ],
+        ),
         builder=_wl06_arc_mosaic,
+        typecode="H",
     ),
     TraceRecipe(
         key="WL07_ADAPTIVE_MIXED",
@@ -492,14 +464,15 @@ TRACE_RECIPES: List[TraceRecipe] = [
         category="ARC",
         goal="Adaptive mixed pattern: switch among multiple patterns every 5,000 requests (ARC-friendly)",
         capacity_hint=(32,),
-        script=[
+        script=(
             "Pattern 1: frequency (pages 1-5 hot, pages 6-20 cold)",
             "Pattern 2: recency (30-page sliding window)",
             "Pattern 3: scan + hot set (for every 50 scans, interleave 5 hot-set accesses)",
             "Switch pattern every 5,000 requests",
             "Expected: ARC ~60%, other algorithms ~30-50% (depending on the current pattern)",
-        ],
+        ),
         builder=_wl07_adaptive_mixed,
+        typecode="H",
     ),
 ]
 
@@ -507,9 +480,133 @@ TRACE_RECIPES: List[TraceRecipe] = [
 TRACE_BY_KEY: Dict[str, TraceRecipe] = {t.key: t for t in TRACE_RECIPES}
 
 
-def generate_trace(key: str) -> List[int]:
+# generated traces kept for the lifetime of the process, keyed by recipe key
+_TRACE_CACHE: Dict[str, Sequence[int]] = {}
+
+# all traces live in one blob holding a TARGET_REQUESTS-long row per recipe, laid out in recipe order;
+# rows are sized by each recipe's typecode and start on 8-byte boundaries
+_ROW_OFFSET: Dict[str, int] = {}
+_BLOB_SIZE = 0
+for _recipe in TRACE_RECIPES:
+    _ROW_OFFSET[_recipe.key] = _BLOB_SIZE
+    _BLOB_SIZE += -(-TARGET_REQUESTS * array(_recipe.typecode).itemsize // 8) * 8
+del _recipe
+_BLOB_PATH = TRACE_CACHE_DIR / f"traces-{_SOURCE_DIGEST}.bin"
+_BLOB_LOCK = threading.Lock()
+
+
+def _build(key: str) -> array:
+    """Run the recipe builder and pack its output in the recipe's storage typecode."""
     recipe = TRACE_BY_KEY[key]
-    return recipe.builder()
+    seq = recipe.builder()
+    if len(seq) != TARGET_REQUESTS:
+        raise ValueError(f"{key} produced {len(seq)} requests, expected {TARGET_REQUESTS}")
+    if seq.typecode != recipe.typecode:
+        seq = array(recipe.typecode, seq)  # raises OverflowError if a page id does not fit
+    return seq
+
+
+def _build_blob(parallel: bool) -> bytearray:
+    """Build every recipe and copy each trace into its row of a fresh blob."""
+    keys = [recipe.key for recipe in TRACE_RECIPES]
+    workers = min(len(keys), os.cpu_count() or 1) if parallel else 1
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            built = list(executor.map(_build, keys))
+    else:
+        built = [_build(key) for key in keys]
+    blob = bytearray(_BLOB_SIZE)
+    for key, seq in zip(keys, built):
+        offset = _ROW_OFFSET[key]
+        blob[offset:offset + len(seq) * seq.itemsize] = memoryview(seq).cast("B")
+    return blob
+
+
+def _load_blob() -> Optional[mmap.mmap]:
+    """Map the cached blob read-only; return None if it is missing, unreadable or mis-sized."""
+    try:
+        with _BLOB_PATH.open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mapped) != _BLOB_SIZE:
+        mapped.close()
+        return None
+    return mapped
+
+
+def _load_all_traces(parallel: bool = False) -> None:
+    """Fill _TRACE_CACHE with a read-only row view per recipe, building the blob if it is not on disk."""
+    with _BLOB_LOCK:
+        if _TRACE_CACHE:
+            return
+        blob = _load_blob()
+        if blob is None:
+            blob = _build_blob(parallel)
+            write_atomic(_BLOB_PATH, blob)  # a failed write only means it is rebuilt next time
+        for recipe in TRACE_RECIPES:
+            offset = _ROW_OFFSET[recipe.key]
+            row = memoryview(blob)[offset:offset + TARGET_REQUESTS * array(recipe.typecode).itemsize]
+            _TRACE_CACHE[recipe.key] = row.cast(recipe.typecode).toreadonly()
+
+
+def generate_trace(key: str) -> Sequence[int]:
+    """
+    Return the trace for a recipe as a read-only sequence of page ids.
+
+    Builders are deterministic, so all traces are generated together once, written to
+    a single blob in TRACE_CACHE_DIR and memory-mapped on later runs; every trace is a
+    view into that one buffer. Repeated calls within a process return the same view.
+    """
+    trace = _TRACE_CACHE.get(key)
+    if trace is None:
+        TRACE_BY_KEY[key]  # unknown keys raise KeyError before anything is built
+        _load_all_traces()
+        trace = _TRACE_CACHE[key]
+    return trace
+
+
+def generate_trace_list(key: str) -> List[int]:
+    """
+    Return a fresh, mutable Python list copy of a recipe's trace.
+
+    Legacy helper for callers that need list semantics; prefer generate_trace, whose
+    shared packed buffer is far smaller than a list of 50,000 boxed ints.
+    """
+    return generate_trace(key).tolist()
+
+
+def stream_trace(key: str) -> Iterator[int]:
+    """
+    Yield the pages of a recipe's trace one at a time.
+
+    Pages are read lazily from the packed (memory-mapped or in-memory) blob behind
+    generate_trace, so consumers that only iterate never box the whole trace into a list.
+    """
+    yield from generate_trace(key)
+
+
+def generate_all_traces(keys: Iterable[str] | None = None) -> Dict[str, Sequence[int]]:
+    """
+    Generate several traces at once, fanning the builders out across worker processes.
+
+    Builders are independent, deterministic module-level functions, so when the blob
+    is not cached on disk each one runs in its own process. Generation stays
+    in-process when only one worker is available.
+
+    Args:
+        keys: Recipe keys to generate. If None, generate every recipe in TRACE_RECIPES.
+
+    Returns:
+        A mapping from recipe key to its generated trace, in the order the keys were given.
+    """
+    selected = list(keys) if keys is not None else [recipe.key for recipe in TRACE_RECIPES]
+    unknown = [key for key in selected if key not in TRACE_BY_KEY]
+    if unknown:
+        raise KeyError(f"Unknown workload keys: {', '.join(unknown)}")
+
+    _load_all_traces(parallel=True)
+    return {key: _TRACE_CACHE[key] for key in selected}
 
 
 __all__ = [
@@ -517,5 +614,8 @@ __all__ = [
     "TRACE_RECIPES",
     "TRACE_BY_KEY",
     "generate_trace",
+    "generate_trace_list",
+    "stream_trace",
+    "generate_all_traces",
 ]
 
@@ -1,25 +1,44 @@
 from __future__ import annotations
 
 import os
+import sys
+from array import array
 from pathlib import Path
 from typing import Iterable
 
-from capsa.trace_suite import TRACE_RECIPES, TraceRecipe, generate_trace
+from capsa.trace_suite import TRACE_RECIPES, TraceRecipe, generate_all_traces
+
+# 跟踪文件格式：连续的 int32 小端整数，每个请求 4 字节
+TRACE_FILE_TYPECODE = "i"
 
 
 def write_trace(path: Path, seq: Iterable[int]) -> None:
-    """将跟踪序列写入文件。"""
+    """将跟踪序列以 int32 小端二进制格式写入文件。"""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        f.write("\n".join(str(x) for x in seq))
+    data = array(TRACE_FILE_TYPECODE, seq)
+    if sys.byteorder != "little":
+        data.byteswap()
+    with path.open("wb") as f:
+        data.tofile(f)
+
+
+def read_trace(path: Path) -> array:
+    """读取 write_trace 写出的二进制跟踪文件。"""
+    data = array(TRACE_FILE_TYPECODE)
+    data.frombytes(path.read_bytes())
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data
 
 
 def main() -> None:
     """生成所有负载的跟踪文件。"""
     out_dir = Path(os.getcwd()) / "traces"
     out_dir.mkdir(parents=True, exist_ok=True)
+    # 各负载的生成器互相独立，由 generate_all_traces 分发到多个进程并行构建
+    traces = generate_all_traces(recipe.key for recipe in TRACE_RECIPES)
     for recipe in TRACE_RECIPES:
-        seq = generate_trace(recipe.key)
+        seq = traces[recipe.key]
         write_trace(out_dir / recipe.filename, seq)
         print(f"[OK] wrote {recipe.filename} ({len(seq)} entries)")
 
@@ -1,97 +1,312 @@
 
 from __future__ import annotations
 
-import argparse
+import hashlib
+import os
+import pickle
+import re
 import sys
-from typing import Callable, Dict, List
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
 
-from capsa.caches import ARCCache, FIFOCache, LFUCache, LRUCache, OPTCache, TwoQCache
+from capsa.cache_base import Cache
+from capsa.caches import ARCCache, FIFOCache, LFUCache, LRUCache, OPTCache, OPTIndex, TwoQCache
 from capsa.metrics import MetricsCollector, ReportConfig
 from capsa.simulator import Simulator, SimulationResult
-from capsa.trace_suite import TRACE_BY_KEY, TRACE_RECIPES, generate_trace
+from capsa.storage import write_atomic
+from capsa.trace_suite import TRACE_BY_KEY, TRACE_RECIPES, generate_all_traces, generate_trace
+
+if TYPE_CHECKING:
+    import argparse
 
 # constant setup
 CACHE_SIZE = 32
-ALGORITHMS = ["LFU", "LRU", "FIFO", "2Q", "ARC", "OPT"]
-NON_OPT_ALGOS = [algo for algo in ALGORITHMS if algo != "OPT"]
+ALGORITHMS = ("LFU", "LRU", "FIFO", "2Q", "ARC", "OPT")  # display (column) order
+NON_OPT_COLUMNS = tuple(col for col, algo in enumerate(ALGORITHMS) if algo != "OPT")  # columns eligible for highlight
+DIRECT_ALGORITHMS = tuple(algo for algo in ALGORITHMS if algo != "2Q")  # simulated as-is; 2Q comes from tuning
 TOTAL_WORKLOADS = len(TRACE_RECIPES)
 
 WORKLOAD_COL_WIDTH = 25
 VALUE_COL_WIDTH = 12
+# the summary table header only depends on the constants above, so it is laid out once at import
+SUMMARY_HEADER = " ".join([f"{'Workload':<{WORKLOAD_COL_WIDTH}}", *(f"{algo:>{VALUE_COL_WIDTH}}" for algo in ALGORITHMS)])
+TABLE_WIDTH = WORKLOAD_COL_WIDTH + len(ALGORITHMS) * (VALUE_COL_WIDTH + 1)  # == len(SUMMARY_HEADER)
 ANSI_RESET = "\033[0m"
 ANSI_BOLD = "\033[1m"
 ANSI_GREEN = "\033[32m"
 SUPPORTS_ANSI = sys.stdout.isatty()
 TWO_Q_A1OUT_FIXED = 32
 TWO_Q_A1IN_MAX = 16
+GOLDEN_RATIO_CONJUGATE = (5 ** 0.5 - 1) / 2
+# "better" markers a recipe goal may carry, matched in one pass
+INDICATOR_RE = re.compile(r"\((?:LFU|LRU|2Q) better\)|\(ARC adaptive\)")
+SELECTION_TOKEN_RE = re.compile(r"[^\s,]+")  # menu input tokens, separated by spaces and/or commas
 
+# on-disk result cache, overridable via CAPSA_RESULT_CACHE; entries are keyed by the trace bytes and by a
+# digest of this file and the capsa package source, so editing any algorithm or the simulator invalidates them
+RESULT_CACHE_DIR = Path(os.environ.get("CAPSA_RESULT_CACHE", Path.home() / ".cache" / "capsa_results"))
+_CODE_ROOT = Path(__file__).resolve().parent
+_CODE_DIGEST = hashlib.sha256(
+    b"".join(path.read_bytes() for path in [_CODE_ROOT / "main.py", *sorted((_CODE_ROOT / "capsa").rglob("*.py"))])
+).hexdigest()
 
-def tune_two_q_offline(cache_size: int, trace: List[int]) -> tuple[int, float]:
-    simulator = Simulator(cache_size, trace)
-    search_upper = min(TWO_Q_A1IN_MAX, cache_size - 1)
-    best_a1in = 1
-    best_hit_rate = -1.0
-    
-    for a1in in range(1, search_upper + 1):
-        cache = TwoQCache(cache_size, a1in_size=a1in, a1out_size=TWO_Q_A1OUT_FIXED)
-        result = simulator.run("2Q", cache)
-        if result.hit_rate > best_hit_rate:
-            best_hit_rate = result.hit_rate
-            best_a1in = a1in
-    
-    return best_a1in, best_hit_rate
+
+# per-process simulator for one workload's trace (set once by the pool initializer in sweep workers)
+# and the 2Q cache for the A1in sweep, which is reset in place for every candidate instead of being reallocated
+_worker_simulator: Simulator | None = None
+_tuning_cache: TwoQCache | None = None
+
+
+def _use_worker_simulator(simulator: Simulator) -> None:
+    global _worker_simulator, _tuning_cache
+    _worker_simulator = simulator
+    _tuning_cache = TwoQCache(simulator.cache_size, a1out_size=TWO_Q_A1OUT_FIXED)
+
+
+def _init_worker(cache_size: int, trace: Sequence[int]) -> None:
+    _use_worker_simulator(Simulator(cache_size, trace))
 
 
-def emphasize_best_cell(text: str) -> str:
+def _run_two_q(a1in: int) -> SimulationResult:
+    _tuning_cache.reset(a1in_size=a1in, a1out_size=TWO_Q_A1OUT_FIXED)
+    return _worker_simulator.run("2Q", _tuning_cache)
+
+
+def _golden_section_two_q(search_upper: int) -> Dict[int, SimulationResult]:
     """
-    highlight the best cell in the table
+    approximate A1in search: golden-section narrowing over [1, search_upper], assuming the hit-rate
+    curve is unimodal, with a linear sweep when the probes show it is not. a peak that falls between
+    probes of an otherwise unimodal-looking curve can still be missed (e.g. WL07 at some cache sizes).
+    returns every probed candidate with its result
+    """
+    probed: Dict[int, SimulationResult] = {}
+    
+    def hit_rate(a1in: int) -> float:
+        if a1in not in probed:
+            probed[a1in] = _run_two_q(a1in)
+        return probed[a1in].hit_rate
+    
+    upper = max(1, search_upper)  # never probe A1in below 1, even for an empty range
+    lo, hi = 1, upper
+    hit_rate(lo)
+    hit_rate(hi)
+    while hi - lo > 2:
+        step = round((hi - lo) * GOLDEN_RATIO_CONJUGATE)
+        left, right = hi - step, lo + step
+        if left >= right:
+            left, right = right - 1, right
+        # on a tie keep the lower half, so plateaus resolve to the smallest A1in like the exact sweep
+        if hit_rate(left) >= hit_rate(right):
+            hi = right
+        else:
+            lo = left
+    for a1in in range(lo, hi + 1):
+        hit_rate(a1in)
+    
+    # the unimodal assumption is checked against what was probed: a unimodal curve only rises and then
+    # falls along A1in, so a rise that follows a fall (a non-monotone fall -> rise transition) means there
+    # are several peaks and the narrowing may have discarded the best one; the rest is then swept linearly
+    ordered = sorted(probed)
+    fell = False
+    non_unimodal = False
+    for left, right in zip(ordered, ordered[1:]):
+        delta = probed[right].hit_rate - probed[left].hit_rate
+        if delta < 0:
+            fell = True
+        elif delta > 0 and fell:
+            non_unimodal = True
+            break
+    if non_unimodal:
+        for a1in in range(1, upper + 1):
+            hit_rate(a1in)
+    return probed
+
+
+def tune_two_q_offline(
+    cache_size: int,
+    trace: Sequence[int],
+    parallel: bool = True,
+    exact: bool = True,
+    simulator: Simulator | None = None,
+) -> tuple[int, float, SimulationResult]:
     """
-    if not SUPPORTS_ANSI:
+    tune A1in and return the best (a1in, hit rate, simulation result).
+    by default every candidate is swept (spread over processes when parallel=True); exact=False uses the
+    faster but approximate golden-section search instead.
+    in-process runs reuse the caller's simulator for this trace when one is given
+    """
+    simulator = simulator or Simulator(cache_size, trace)
+    # a one-page cache still gets a single candidate (TwoQCache clamps A1in to what fits)
+    search_upper = max(1, min(TWO_Q_A1IN_MAX, cache_size - 1))
+    candidates = range(1, search_upper + 1)
+    workers = min(len(candidates), os.cpu_count() or 1) if parallel else 1
+    
+    if not exact:
+        _use_worker_simulator(simulator)
+        probed = _golden_section_two_q(search_upper)
+        candidates = sorted(probed)
+        results = [probed[a1in] for a1in in candidates]
+    elif workers > 1:
+        # each worker receives the trace once (packed, since views cannot be pickled)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(cache_size, array("i", trace)),
+        ) as executor:
+            results = list(executor.map(_run_two_q, candidates))
+    else:
+        _use_worker_simulator(simulator)
+        results = [_run_two_q(a1in) for a1in in candidates]
+    
+    # candidates are in ascending order and max keeps the first best, so ties resolve to the smallest A1in
+    best = max(range(len(results)), key=lambda i: results[i].hit_rate)
+    best_a1in, best_result = candidates[best], results[best]
+    if exact and workers > 1:
+        # pooled runs were timed while sibling candidates competed for the same cores; the winner is rerun
+        # here so its elapsed_ns is measured alone like every other algorithm's (the hit counts are identical)
+        _use_worker_simulator(simulator)
+        best_result = _run_two_q(best_a1in)
+    
+    return best_a1in, best_result.hit_rate, best_result
+
+
+# whether the terminal supports ANSI is fixed at startup, so the highlighter is picked once instead of per cell
+if SUPPORTS_ANSI:
+    _HIGHLIGHT_PREFIX = f"{ANSI_BOLD}{ANSI_GREEN}"
+
+    def emphasize_best_cell(text: str) -> str:
+        """
+        highlight the best cell in the table
+        """
+        return f"{_HIGHLIGHT_PREFIX}{text}{ANSI_RESET}"
+else:
+
+    def emphasize_best_cell(text: str) -> str:
+        """
+        highlight the best cell in the table (plain output: no ANSI support)
+        """
         return text
-    return f"{ANSI_BOLD}{ANSI_GREEN}{text}{ANSI_RESET}"
 
 
-def build_cache_factories(
-    cache_size: int,
-    trace: List[int],
-    *,
-    two_q_params: Dict[str, object] | None = None,
-) -> Dict[str, Callable[[], object]]:
+def build_cache(algo_name: str, cache_size: int, opt_index: OPTIndex | None = None) -> Cache:
+    """
+    build the cache instance for one algorithm (2Q is built by offline tuning instead);
+    OPT needs the trace's opt_index, since without it the cache cannot see future accesses
     """
-    build cache instance for all algorithms
+    match algo_name:
+        case "LRU":
+            return LRUCache(cache_size)
+        case "LFU":
+            return LFUCache(cache_size)
+        case "FIFO":
+            return FIFOCache(cache_size)
+        case "ARC":
+            return ARCCache(cache_size)
+        case "OPT":
+            if opt_index is None:
+                raise ValueError("OPT needs the OPTIndex of the trace it will run on")
+            return OPTCache(cache_size, opt_index)
+    raise ValueError(f"Unknown algorithm '{algo_name}'")
+
+
+# simulations are deterministic, so each (cache size, workload, exact tuning) combination is simulated once per process
+_WORKLOAD_CACHE: Dict[tuple[int, str, bool], tuple[int, float, List[SimulationResult]]] = {}
+# notes on where a workload's timings came from, for entries not timed by this process
+_TIMING_NOTES: Dict[tuple[int, str, bool], str] = {}
+
+
+def _result_cache_path(cache_size: int, recipe_key: str, exact_tune: bool, trace: Sequence[int]) -> Path:
+    digest = hashlib.sha256(_CODE_DIGEST.encode())
+    digest.update(memoryview(trace).tobytes() if isinstance(trace, (array, memoryview)) else array("q", trace).tobytes())
+    tuning = "exact" if exact_tune else "golden"
+    return RESULT_CACHE_DIR / f"{recipe_key}-{cache_size}-{tuning}-{digest.hexdigest()[:16]}.pkl"
+
+
+def _load_results(path: Path) -> Optional[tuple[int, float, List[SimulationResult]]]:
     """
-    return {
-        "LRU": lambda: LRUCache(cache_size),
-        "LFU": lambda: LFUCache(cache_size),
-        "FIFO": lambda: FIFOCache(cache_size),
-        "ARC": lambda: ARCCache(cache_size),
-        "OPT": lambda: OPTCache(cache_size, trace),
-        "2Q": lambda: TwoQCache(cache_size, **(two_q_params or {})),
-    }
+    read cached workload results; None if the entry is missing or unreadable
+    """
+    try:
+        with path.open("rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, AttributeError, ValueError, pickle.UnpicklingError):
+        return None
 
 
-def run_workload(cache_size: int, recipe_key: str, silent: bool = False) -> List[SimulationResult]:
+def simulate_workload(
+    cache_size: int,
+    recipe_key: str,
+    parallel: bool = True,
+    exact_tune: bool = True,
+    use_cache: bool = True,
+) -> tuple[int, float, List[SimulationResult]]:
     """
-    run a single workload and return results
+    tune 2Q and simulate every algorithm on a workload; returns (best a1in, best 2Q hit rate, results).
+    results are reused from RESULT_CACHE_DIR unless use_cache=False, which reruns and refreshes them
     """
-    recipe = TRACE_BY_KEY[recipe_key]
+    cached = _WORKLOAD_CACHE.get((cache_size, recipe_key, exact_tune))
+    if cached is not None:
+        return cached
+    
     trace = generate_trace(recipe_key)
-    best_a1in, best_two_q_hit = tune_two_q_offline(cache_size, trace)
-    two_q_params = {"a1in_size": best_a1in, "a1out_size": TWO_Q_A1OUT_FIXED}
-    factories = build_cache_factories(cache_size, trace, two_q_params=two_q_params)
+    cache_path = _result_cache_path(cache_size, recipe_key, exact_tune, trace)
+    cached = _load_results(cache_path) if use_cache else None
+    if cached is not None:
+        # hit counts are deterministic, but the elapsed times are those of the run that wrote the entry
+        _WORKLOAD_CACHE[(cache_size, recipe_key, exact_tune)] = cached
+        _TIMING_NOTES[(cache_size, recipe_key, exact_tune)] = (
+            "reused from the result cache (rerun with --no-cache to re-time)"
+        )
+        return cached
+    
+    # one simulator serves both the 2Q tuning runs and the final runs of every other algorithm
     simulator = Simulator(cache_size, trace)
-    results = []
+    # only the 2Q sweep, which just needs hit rates, may use a process pool; the reported runs (the
+    # winning 2Q and every other algorithm) are timed serially in this process so their elapsed_ns compare
+    best_a1in, best_two_q_hit, best_two_q_result = tune_two_q_offline(
+        cache_size, trace, parallel=parallel, exact=exact_tune, simulator=simulator
+    )
+    opt_index = OPTIndex(trace)  # built once per trace
+    pending = iter([
+        simulator.run(algo_name, build_cache(algo_name, cache_size, opt_index)) for algo_name in DIRECT_ALGORITHMS
+    ])
+    # the winning tuning run already simulated 2Q with the chosen parameters
+    results = [best_two_q_result if algo_name == "2Q" else next(pending) for algo_name in ALGORITHMS]
     
-    for algo_name in ALGORITHMS:
-        cache = factories[algo_name]()
-        results.append(simulator.run(algo_name, cache))
+    cached = _WORKLOAD_CACHE[(cache_size, recipe_key, exact_tune)] = (best_a1in, best_two_q_hit, results)
+    _TIMING_NOTES.pop((cache_size, recipe_key, exact_tune), None)
+    write_atomic(cache_path, pickle.dumps(cached))  # a failed write only means a rerun next time
+    return cached
+
+
+def run_workload(
+    cache_size: int,
+    recipe_key: str,
+    silent: bool = False,
+    parallel: bool = True,
+    exact_tune: bool = True,
+    use_cache: bool = True,
+) -> List[SimulationResult]:
+    """
+    run a single workload and return results; parallel=False keeps the 2Q sweep in this process,
+    exact_tune=False uses the approximate golden-section search instead of sweeping every A1in,
+    use_cache=False ignores results saved by earlier runs
+    """
+    recipe = TRACE_BY_KEY[recipe_key]
+    best_a1in, best_two_q_hit, results = simulate_workload(
+        cache_size, recipe_key, parallel=parallel, exact_tune=exact_tune, use_cache=use_cache
+    )
+    results = list(results)  # callers may modify their list without touching the cached one
     
     if not silent:
         params = {
             "recipe": recipe.key,
             "category": recipe.category,
-            "steps": list(recipe.script),
-            "capacity_hint": list(recipe.capacity_hint),
+            # both fields are tuples (immutable, not just held by a frozen recipe), so they are passed without copies
+            "steps": recipe.script,
+            "capacity_hint": recipe.capacity_hint,
             "two_q_best_a1in": best_a1in,
             "two_q_best_hit_rate": round(best_two_q_hit, 2),
         }
@@ -99,53 +314,70 @@ def run_workload(cache_size: int, recipe_key: str, silent: bool = False) -> List
             cache_size=cache_size,
             workload_name=recipe.category,
             workload_params=params,
-            total_requests=len(trace),
+            total_requests=len(generate_trace(recipe_key)),
         )
         collector = MetricsCollector(report_config)
         print(collector.build_report(results))
         print(f"[2Q offline tuning] A1in={best_a1in}, A1out={TWO_Q_A1OUT_FIXED}, HitRate={best_two_q_hit:.2f}%")
+        timing_note = _TIMING_NOTES.get((cache_size, recipe_key, exact_tune))
+        if timing_note:
+            print(f"[Timing] {timing_note}")
     
     return results
 
 
+def workload_hit_rates(
+    recipe_key: str, parallel: bool = True, exact_tune: bool = True, use_cache: bool = True
+) -> Dict[str, float]:
+    """
+    run a workload silently and reduce its results to {algorithm: hit rate}, cheap to send between processes
+    """
+    results = run_workload(
+        CACHE_SIZE, recipe_key, silent=True, parallel=parallel, exact_tune=exact_tune, use_cache=use_cache
+    )
+    return {result.algorithm: result.hit_rate for result in results}
+
+
 def extract_better_indicator(goal: str) -> str:
     """   
     Returns:
         if goal contains any better indicator, return the indicator, otherwise return empty string
     """
-    indicators = ["(LFU better)", "(LRU better)", "(2Q better)", "(ARC adaptive)"]
-    for indicator in indicators:
-        if indicator in goal:
-            return indicator
-    return ""
+    match = INDICATOR_RE.search(goal)
+    return match.group() if match else ""
 
 
 def format_workload_description(recipe) -> tuple[str, str]:
     indicator = extract_better_indicator(recipe.goal)
-    clean_goal = recipe.goal
-    for ind in ["(LFU better)", "(LRU better)", "(2Q better)", "(ARC adaptive)"]:
-        clean_goal = clean_goal.replace(ind, "")
-    clean_goal = clean_goal.strip()
+    clean_goal = INDICATOR_RE.sub("", recipe.goal).strip()
     return indicator, clean_goal
 
 
 def display_workload_menu() -> None:
-    print("\n" + "=" * 60)
-    print("Cache Performance Analysis - Workload Selection")
-    print("=" * 60)
-    print(f"\nCache Size: {CACHE_SIZE} pages")
-    print(f"Requests per workload: 50000\n")
-    print("Available Workloads:")
-    print("-" * 60)
+    # the whole menu is assembled first and written in one go
+    lines = [
+        "",
+        "=" * 60,
+        "Cache Performance Analysis - Workload Selection",
+        "=" * 60,
+        "",
+        f"Cache Size: {CACHE_SIZE} pages",
+        f"Requests per workload: 50000",
+        "",
+        "Available Workloads:",
+        "-" * 60,
+    ]
     
     for idx, recipe in enumerate(TRACE_RECIPES, 1):
         indicator, clean_goal = format_workload_description(recipe)
-        print(f"{idx}. {recipe.key} {indicator}")
-        print(f"   {clean_goal}")
+        lines.append(f"{idx}. {recipe.key} {indicator}")
+        lines.append(f"   {clean_goal}")
     
-    print("-" * 60)
-    print(f"\nEnter workload numbers (1-{TOTAL_WORKLOADS}) separated by spaces or commas (e.g., 1 3 5 or 1,3,5):")
-    print("Or press Enter to run all workloads:")
+    lines.append("-" * 60)
+    lines.append("")
+    lines.append(f"Enter workload numbers (1-{TOTAL_WORKLOADS}) separated by spaces or commas (e.g., 1 3 5 or 1,3,5):")
+    lines.append("Or press Enter to run all workloads:")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def parse_user_selection(user_input: str, num_workloads: int) -> List[int]:
@@ -153,7 +385,7 @@ def parse_user_selection(user_input: str, num_workloads: int) -> List[int]:
         return list(range(1, num_workloads + 1))
     
     selections = []
-    for part in user_input.replace(",", " ").split():
+    for part in SELECTION_TOKEN_RE.findall(user_input):
         try:
             num = int(part)
             if 1 <= num <= num_workloads:
@@ -203,54 +435,71 @@ def parse_workload_argument(arg: str) -> tuple[int | None, str | None]:
     )
 
 
-def run_all_workloads_summary() -> None:
-    print("\n" + "=" * 80)
-    print("CAPSA - Running all workloads with summary table")
-    print("=" * 80)
-    print(f"\nCache size: {CACHE_SIZE} pages")
-    print(f"Requests per workload: 50000\n")
-    print("Running all workloads, please wait...\n")
-    
-    all_results: Dict[str, Dict[str, float]] = {}
+def format_summary_row(workload_name: str, workload_results: Dict[str, float]) -> str:
+    """
+    render one summary table row; hit rates are laid out in ALGORITHMS column order,
+    so the best non-OPT value and the cells to highlight are found by column index
+    """
+    row = [workload_results.get(algo, 0.0) for algo in ALGORITHMS]
+    best_hit_rate = max((row[col] for col in NON_OPT_COLUMNS), default=0.0)
+    cells = [f"{hit_rate:>{VALUE_COL_WIDTH}.2f}" for hit_rate in row]
+    for col in NON_OPT_COLUMNS:
+        if abs(row[col] - best_hit_rate) < 1e-9:
+            cells[col] = emphasize_best_cell(cells[col])
+    return " ".join([f"{workload_name:<{WORKLOAD_COL_WIDTH}}", *cells])
+
+
+def run_all_workloads_summary(exact_tune: bool = True, use_cache: bool = True) -> None:
+    # everything up to the first row is known before any simulation runs, so it goes out in one write
+    preamble = [
+        "",
+        "=" * 80,
+        "CAPSA - Running all workloads with summary table",
+        "=" * 80,
+        "",
+        f"Cache size: {CACHE_SIZE} pages",
+        "Requests per workload: 50000",
+        "",
+        "Running all workloads, rows appear as each workload finishes...",
+        "",
+        "=" * 80,
+        "Hit rate summary (%)",
+        "=" * 80,
+        "",
+        SUMMARY_HEADER,
+        "-" * TABLE_WIDTH,
+    ]
+    sys.stdout.write("\n".join(preamble) + "\n")
+    sys.stdout.flush()
     
-    for idx, recipe in enumerate(TRACE_RECIPES, 1):
-        print(f"Running workload {idx}/{TOTAL_WORKLOADS}: {recipe.key}...", end=" ", flush=True)
-        results = run_workload(CACHE_SIZE, recipe.key, silent=True)
-
-        workload_results = {}
-        for result in results:
-            workload_results[result.algorithm] = result.hit_rate
-        all_results[recipe.key] = workload_results
-        print("Done")
+    # rows are printed in workload name order as soon as every row before them is ready
+    keys = sorted(recipe.key for recipe in TRACE_RECIPES)
+    workers = min(len(keys), os.cpu_count() or 1)
     
-
-    print("\n" + "=" * 80)
-    print("Hit rate summary (%)")
-    print("=" * 80 + "\n")
-
-    header_cells = [f"{'Workload':<{WORKLOAD_COL_WIDTH}}"]
-    header_cells.extend(f"{algo:>{VALUE_COL_WIDTH}}" for algo in ALGORITHMS)
-    header = " ".join(header_cells)
-    table_width = len(header.replace(ANSI_BOLD, "").replace(ANSI_GREEN, "").replace(ANSI_RESET, ""))
-    print(header)
-    print("-" * table_width)
-    
-    # display
-    for workload_name in sorted(all_results.keys()):
-        workload_results = all_results[workload_name]
-        best_hit_rate = (
-            max((workload_results.get(algo, 0.0) for algo in NON_OPT_ALGOS), default=0.0)
-            if workload_results
-            else 0.0
-        )
-        row_cells = [f"{workload_name:<{WORKLOAD_COL_WIDTH}}"]
-        for algo in ALGORITHMS:
-            hit_rate = workload_results.get(algo, 0.0)
-            cell = f"{hit_rate:>{VALUE_COL_WIDTH}.2f}"
-            if algo != "OPT" and abs(hit_rate - best_hit_rate) < 1e-9:
-                cell = emphasize_best_cell(cell)
-            row_cells.append(cell)
-        print(" ".join(row_cells))
+    if workers > 1:
+        # workloads are independent: build the traces once up front (workers map the cached blob),
+        # then simulate each workload in its own process; finished rows wait only for earlier ones.
+        # the cores are already busy with workloads, so the 2Q sweep inside each one stays serial
+        generate_all_traces(keys)
+        finished: Dict[str, Dict[str, float]] = {}
+        next_row = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(workload_hit_rates, key, False, exact_tune, use_cache): key for key in keys}
+            for future in as_completed(futures):
+                finished[futures[future]] = future.result()
+                # rows unblocked by this result are written together
+                ready_rows = []
+                while next_row < len(keys) and keys[next_row] in finished:
+                    ready_rows.append(format_summary_row(keys[next_row], finished.pop(keys[next_row])) + "\n")
+                    next_row += 1
+                if ready_rows:
+                    sys.stdout.write("".join(ready_rows))
+                    sys.stdout.flush()
+    else:
+        for key in keys:
+            workload_results = workload_hit_rates(key, exact_tune=exact_tune, use_cache=use_cache)
+            sys.stdout.write(format_summary_row(key, workload_results) + "\n")
+            sys.stdout.flush()
     
     print("\n" + "=" * 80)
 
@@ -283,9 +532,11 @@ def run_arc_sensitivity_analysis() -> None:
 
 
 def parse_arguments(argv: list[str]) -> argparse.Namespace:
+    import argparse  # only needed off the plain "-N" fast path in main()
+
     parser = argparse.ArgumentParser(
         description="CAPSA - Cache Algorithm Performance Simulator & Analyzer",
-        epilog="Examples:\n  python main.py -1          # Run workload 1\n  python main.py -1 -3 -5    # Run workloads 1, 3, 5\n  python main.py -all         # Run all workloads with summary table\n  python main.py -arc        # Run ARC sensitivity analysis\n  python main.py             # Interactive menu",
+        epilog="Examples:\n  python main.py -1          # Run workload 1\n  python main.py -1 -3 -5    # Run workloads 1, 3, 5\n  python main.py -all         # Run all workloads with summary table\n  python main.py -arc        # Run ARC sensitivity analysis\n  python main.py             # Interactive menu\n  python main.py -all --no-cache --fast-tune  # Options combine with any mode",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
@@ -293,6 +544,16 @@ def parse_arguments(argv: list[str]) -> argparse.Namespace:
         nargs="*",
         help=f"Workload numbers (1-{TOTAL_WORKLOADS}) or workload keys. Use -1 for workload 1, etc.",
     )
+    parser.add_argument(
+        "--fast-tune",
+        action="store_true",
+        help="Tune 2Q A1in with the approximate golden-section search instead of sweeping every value.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rerun simulations instead of reusing results saved by earlier runs.",
+    )
     return parser.parse_args(argv)
 
 
@@ -311,22 +572,36 @@ def main() -> None:
     
     Mode 4: Run ARC sensitivity analysis
     python main.py -arc        # Run ARC cache size sensitivity analysis for WL07
+
+    Add --fast-tune to any mode to tune 2Q A1in with the approximate golden-section search (may miss the best value)
+    Add --no-cache to any mode to rerun simulations instead of reusing results saved in RESULT_CACHE_DIR
     """
-    if len(sys.argv) > 1:
-        arg_lower = sys.argv[1].lower()
-        if arg_lower in ["-all", "--all"]:
-            run_all_workloads_summary()
-            return
-        elif arg_lower in ["-arc", "--arc"]:
-            run_arc_sensitivity_analysis()
-            return
+    argv = sys.argv[1:]
+    # -all / -arc are matched by hand (argparse would take them for unknown options); whatever
+    # follows them is parsed like any other command line, so the options behave the same in every mode
+    mode = argv[0].lower() if argv else ""
+    if mode in ["-all", "--all", "-arc", "--arc"]:
+        argv = argv[1:]
+    
+    # plain "-N" selections carry no options and are handled without building an argparse parser;
+    # anything else (workload keys, --fast-tune, --no-cache, --help, ...) goes through parse_arguments
+    if all(arg.startswith("-") and arg[1:].isdigit() for arg in argv):
+        workload_args, exact_tune, use_cache = argv, True, True
+    else:
+        args = parse_arguments(argv)
+        workload_args, exact_tune, use_cache = args.workloads, not args.fast_tune, not args.no_cache
     
-    args = parse_arguments(sys.argv[1:])
+    if mode in ["-all", "--all"]:
+        run_all_workloads_summary(exact_tune=exact_tune, use_cache=use_cache)
+        return
+    elif mode in ["-arc", "--arc"]:
+        run_arc_sensitivity_analysis()
+        return
     
     selected_indices: List[int] = []
     workload_keys: List[str] = []
     
-    for arg in args.workloads:
+    for arg in workload_args:
         try:
             idx, key = parse_workload_argument(arg)
             if idx is not None:
@@ -346,16 +621,12 @@ def main() -> None:
     # run selected workloads
     for idx in selected_indices:
         recipe = TRACE_RECIPES[idx - 1]  
-        print(f"\n{'=' * 60}")
-        print(f"Running Workload {idx}: {recipe.key}")
-        print(f"{'=' * 60}\n")
-        run_workload(CACHE_SIZE, recipe.key)
+        sys.stdout.write(f"\n{'=' * 60}\nRunning Workload {idx}: {recipe.key}\n{'=' * 60}\n\n")
+        run_workload(CACHE_SIZE, recipe.key, exact_tune=exact_tune, use_cache=use_cache)
     
     for key in workload_keys:
-        print(f"\n{'=' * 60}")
-        print(f"Running Workload: {key}")
-        print(f"{'=' * 60}\n")
-        run_workload(CACHE_SIZE, key)
+        sys.stdout.write(f"\n{'=' * 60}\nRunning Workload: {key}\n{'=' * 60}\n\n")
+        run_workload(CACHE_SIZE, key, exact_tune=exact_tune, use_cache=use_cache)
 
 
 if __name__ == "__main__":